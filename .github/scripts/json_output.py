@@ -0,0 +1,38 @@
+"""
+JSON output shared by the scripts, using orjson when it is installed
+"""
+
+import json
+import os
+import sys
+from typing import Any, TextIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Indent only for people reading a terminal (or PRETTY_JSON=1);
+# output piped between CI steps stays compact
+PRETTY = sys.stdout.isatty() or os.environ.get('PRETTY_JSON') == '1'
+
+_JSON_OPTIONS = {'indent': 2} if PRETTY else {'separators': (',', ':')}
+
+
+def json_dumps(data: Any) -> str:
+    """
+    Serialize data as JSON, keeping non-ASCII characters as-is
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if PRETTY else 0).decode('utf-8')
+    return json.dumps(data, ensure_ascii=False, **_JSON_OPTIONS)
+
+
+def json_dump(data: Any, fp: TextIO) -> None:
+    """
+    Write data as JSON to a file object
+    """
+    if orjson is not None:
+        fp.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if PRETTY else 0).decode('utf-8'))
+    else:
+        json.dump(data, fp, ensure_ascii=False, **_JSON_OPTIONS)
@@ -6,12 +6,20 @@ Python 3.12+ compatible script for parsing release notes and creating GitHub Dis
 
 import json
 import logging
+import re
 import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from pathlib import Path
+from typing import List, Optional, Dict, Any, TextIO
+from urllib.parse import urlparse
 import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import soupsieve as sv
+from bs4 import BeautifulSoup, FeatureNotFound
+
+from json_output import json_dump, json_dumps
 
 logging.basicConfig(
     level=logging.INFO,
@@ -19,8 +27,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_VERSION_RE = re.compile(r'(\d+[.\-]\d+[.\-]\d+)')
+# Only a version that follows 'release-' in the URL path counts, not hosts or dates
+_RELEASE_URL_RE = re.compile(r'release-(\d+[.\-]\d+[.\-]\d+)')
+
+# Common content area selectors, compiled once instead of on every select_one()
+_CONTENT_SELECTORS = [
+    sv.compile(selector)
+    for selector in (
+        'main',
+        'article',
+        '[role="main"]',
+        '.content',
+        '.main-content',
+        '#content',
+        '.documentation-content'
+    )
+]
+
+# Tags ending a feature description, and tags that contribute to it
+FEATURE_BOUNDARY_TAGS = frozenset({'h3', 'h4'})
+DESCRIPTION_TAGS = frozenset({'p', 'ul', 'ol', 'div'})
+
+# Categories, feature titles and accordion containers, in document order
+_STRUCTURE_SELECTOR = sv.compile('h3, h4, details.accordion, div.accordion')
 
-@dataclass
+# Feature titles inside an accordion container
+_ACCORDION_TITLE_SELECTOR = sv.compile('summary, .accordion-header, .accordion-title')
+
+# Validators and bodies from previous fetches, keyed by URL
+CACHE_FILE = Path('.cache') / 'release_notes_etag.json'
+
+
+@dataclass(slots=True)
 class Feature:
     """Represents a single feature in the release notes"""
     title: str
@@ -32,7 +71,7 @@ class Feature:
         return f"### {self.title}\n\n{self.description}"
 
 
-@dataclass
+@dataclass(slots=True)
 class ReleaseNotes:
     """Container for all release notes"""
     version: str
@@ -40,31 +79,30 @@ class ReleaseNotes:
     
     def to_discussion_body(self) -> str:
         """Generate the main discussion body"""
-        body = f"# Netskope Release {self.version} - New Features and Enhancements\n\n"
-        body += "This discussion contains all the new features and enhancements "
-        body += f"from Netskope Release {self.version}.\n\n"
-        body += "Each feature is posted as a separate comment below for easy reference and discussion.\n\n"
-        body += f"**Total Features:** {len(self.features)}\n\n"
+        parts = [
+            f"# Netskope Release {self.version} - New Features and Enhancements\n\n",
+            "This discussion contains all the new features and enhancements ",
+            f"from Netskope Release {self.version}.\n\n",
+            "Each feature is posted as a separate comment below for easy reference and discussion.\n\n",
+            f"**Total Features:** {len(self.features)}\n\n"
+        ]
         
         # Create a summary by category
-        categories = {}
+        categories = defaultdict(list)
         for feature in self.features:
-            if feature.category not in categories:
-                categories[feature.category] = []
             categories[feature.category].append(feature.title)
         
-        body += "## Features by Category\n\n"
+        parts.append("## Features by Category\n\n")
         for category, titles in sorted(categories.items()):
-            body += f"### {category}\n"
-            for title in titles:
-                body += f"- {title}\n"
-            body += "\n"
+            parts.append(f"### {category}\n")
+            parts.extend(f"- {title}\n" for title in titles)
+            parts.append("\n")
         
-        return body
+        return ''.join(parts)
     
-    def to_json(self) -> str:
-        """Export release notes as JSON"""
-        data = {
+    def to_dict(self) -> Dict[str, Any]:
+        """Export release notes as a JSON-serializable dict"""
+        return {
             "version": self.version,
             "features": [
                 {
@@ -75,7 +113,14 @@ class ReleaseNotes:
                 for f in self.features
             ]
         }
-        return json.dumps(data, indent=2, ensure_ascii=False)
+    
+    def to_json(self) -> str:
+        """Export release notes as JSON"""
+        return json_dumps(self.to_dict())
+    
+    def dump_json(self, fp: TextIO) -> None:
+        """Write release notes as JSON to a file object"""
+        json_dump(self.to_dict(), fp)
 
 
 class ReleaseNotesParser:
@@ -87,21 +132,77 @@ class ReleaseNotesParser:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (compatible; GitHubActions/1.0)'
         })
+        
+        # Pool connections and retry transient gateway errors on flaky runners
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+    
+    def load_cache(self) -> Dict[str, Any]:
+        """Load the conditional GET cache, or an empty one if unavailable"""
+        try:
+            with open(CACHE_FILE, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"No usable page cache: {e}")
+            return {}
+    
+    def save_cache(self, cache: Dict[str, Any]) -> None:
+        """Persist the conditional GET cache"""
+        try:
+            CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"Failed to write page cache: {e}")
     
     def fetch_page(self) -> str:
         """Fetch the HTML content of the release notes page"""
+        cache = self.load_cache()
+        cached = cache.get(self.url)
+        
+        # Revalidate the cached copy instead of downloading it again
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
         try:
             logger.info(f"Fetching page: {self.url}")
-            response = self.session.get(self.url, timeout=30)
+            response = self.session.get(self.url, headers=headers, timeout=30)
+            if response.status_code == 304 and cached:
+                logger.info("Page not modified, using cached content")
+                return cached['html_content']
             response.raise_for_status()
-            return response.text
         except requests.RequestException as e:
             logger.error(f"Failed to fetch page: {e}")
             raise
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            cache[self.url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'html_content': response.text
+            }
+            self.save_cache(cache)
+        
+        return response.text
     
     def parse_html(self, html_content: str) -> ReleaseNotes:
         """Parse HTML content and extract release notes"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        try:
+            soup = BeautifulSoup(html_content, 'lxml')
+        except FeatureNotFound:
+            logger.warning("lxml is not installed, falling back to html.parser")
+            soup = BeautifulSoup(html_content, 'html.parser')
         
         # Extract version from URL or title
         version = self.extract_version(soup)
@@ -116,39 +217,41 @@ class ReleaseNotesParser:
         current_category = "General"
         
         # Process all elements in the content area
-        for element in content_area.find_all(['h3', 'h4', 'div', 'details']):
-            # Handle accordion/details elements
-            if element.name in ['details', 'div'] and 'accordion' in element.get('class', []):
-                features = self.parse_accordion(element, current_category)
-                release_notes.features.extend(features)
+        for element in _STRUCTURE_SELECTOR.select(content_area):
+            name = element.name
             
             # H3 elements define categories
-            elif element.name == 'h3':
+            if name == 'h3':
                 current_category = element.get_text(strip=True)
                 logger.info(f"Found category: {current_category}")
             
             # H4 elements define feature titles
-            elif element.name == 'h4':
+            elif name == 'h4':
                 feature = self.parse_feature(element, current_category)
                 if feature:
                     release_notes.features.append(feature)
+            
+            # Everything else matched is an accordion/details container
+            else:
+                features = self.parse_accordion(element, current_category)
+                release_notes.features.extend(features)
         
         logger.info(f"Parsed {len(release_notes.features)} features")
         return release_notes
     
     def extract_version(self, soup: BeautifulSoup) -> str:
         """Extract version number from page"""
-        # Try to extract from URL
-        if '129-0-0' in self.url:
-            return '129.0.0'
+        # Try to extract from URL, which usually encodes the version
+        match = _RELEASE_URL_RE.search(urlparse(self.url).path)
+        if match:
+            return match.group(1).replace('-', '.')
         
         # Try to extract from page title
         title = soup.find('title')
         if title:
             title_text = title.get_text()
             if 'Release' in title_text:
-                import re
-                match = re.search(r'(\d+[\.\-]\d+[\.\-]\d+)', title_text)
+                match = _VERSION_RE.search(title_text)
                 if match:
                     return match.group(1).replace('-', '.')
         
@@ -156,19 +259,8 @@ class ReleaseNotesParser:
     
     def find_content_area(self, soup: BeautifulSoup) -> Optional[BeautifulSoup]:
         """Find the main content area of the page"""
-        # Common content area selectors
-        selectors = [
-            'main',
-            'article',
-            '[role="main"]',
-            '.content',
-            '.main-content',
-            '#content',
-            '.documentation-content'
-        ]
-        
-        for selector in selectors:
-            content = soup.select_one(selector)
+        for selector in _CONTENT_SELECTORS:
+            content = selector.select_one(soup)
             if content:
                 return content
         
@@ -180,8 +272,7 @@ class ReleaseNotesParser:
         features = []
         
         # Look for summary/header and content pairs
-        summaries = element.find_all(['summary', '.accordion-header', '.accordion-title'])
-        contents = element.find_all(['div', '.accordion-content', '.accordion-body'])
+        summaries = _ACCORDION_TITLE_SELECTOR.select(element)
         
         for summary in summaries:
             title = summary.get_text(strip=True)
@@ -208,8 +299,11 @@ class ReleaseNotesParser:
         description_parts = []
         sibling = element.find_next_sibling()
         
-        while sibling and sibling.name not in ['h3', 'h4']:
-            if sibling.name in ['p', 'ul', 'ol', 'div']:
+        while sibling:
+            name = sibling.name
+            if name in FEATURE_BOUNDARY_TAGS:
+                break
+            if name in DESCRIPTION_TAGS:
                 text = self.extract_text_content(sibling)
                 if text:
                     description_parts.append(text)
@@ -256,7 +350,8 @@ def main():
         release_notes = parser.parse()
         
         # Output as JSON for GitHub Actions
-        print(release_notes.to_json())
+        release_notes.dump_json(sys.stdout)
+        sys.stdout.write('\n')
         
     except Exception as e:
         logger.error(f"Failed to parse release notes: {e}")
@@ -4,23 +4,171 @@ Parse Netskope Release Notes using Playwright
 Enhanced version with better accordion handling and structure parsing
 """
 
-import json
+import atexit
+import functools
 import sys
 import logging
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional
+from dataclasses import dataclass, field
+from itertools import zip_longest
+from typing import Dict, Iterator, List, TextIO, Tuple
 from urllib.parse import urlparse
 import re
 
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
+from lxml import etree, html
+
+from json_output import json_dump, json_dumps
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Regexes and XPath expressions are compiled once at import time and reused for every page
+_RELEASE_URL_RE = re.compile(r'release-(\d+-\d+-\d+)')
+_VERSION_RE = re.compile(r'(\d+\.\d+\.\d+)')
+_WHITESPACE_RE = re.compile(r'\s+')
+_MAIN_CONTENT = [
+    etree.XPath('(//main)[1]'),
+    etree.XPath('(//article)[1]'),
+    etree.XPath("(//div[contains(concat(' ', normalize-space(@class), ' '), ' content ')])[1]"),
+]
+_HEADINGS = etree.XPath('.//*[self::h2 or self::h3 or self::h4 or self::h5 or self::h6]')
+_TEXT = etree.XPath('.//text()[not(parent::script or parent::style)]', smart_strings=False)
+# Whitespace-only text nodes never reach the output; leave them out of the tree
+_HTML_PARSER = html.HTMLParser(remove_blank_text=True)
+
+# Tag sets checked for every node, built once for O(1) membership tests
+HEADING_TAGS = frozenset({'h2', 'h3', 'h4', 'h5', 'h6'})
+CATEGORY_TAGS = frozenset({'h2', 'h3'})
+SUBHEADING_TAGS = frozenset({'h3', 'h4', 'h5', 'h6'})
+BLOCK_TAGS = frozenset({'p', 'div', 'section', 'article'})
+SKIP_TAGS = frozenset({'script', 'style', 'noscript'})
+SPACER_TAGS = frozenset({'br', 'hr'})
+NAVIGATION_KEYWORDS = ('table of contents', 'navigation', 'menu', 'search')
+
+# Headings the parser needs; their presence means the page content has rendered
+CONTENT_READY_SELECTOR = 'main h2, main h3, article h2, article h3, div.content h2, div.content h3'
+
+# Various types of expandable elements, clicked in a single in-page sweep
+EXPANDABLE_SELECTORS = [
+    'button[aria-expanded="false"]',
+    '.accordion-toggle[aria-expanded="false"]',
+    '.collapsible:not(.active)',
+    '[data-toggle="collapse"]:not(.collapsed)',
+    '.expandable:not(.expanded)'
+]
+_EXPAND_ALL_JS = """(selectors) => {
+    let clicked = 0;
+    for (const selector of selectors) {
+        document.querySelectorAll(selector).forEach(element => {
+            try {
+                element.click();
+                clicked++;
+            } catch (e) {}
+        });
+    }
+    return clicked;
+}"""
+
+
+def get_text(element) -> str:
+    """Return the stripped text of an element, skipping script and style contents"""
+    return ''.join(text.strip() for text in _TEXT(element))
+
+
+def has_substantial_text(element, min_length: int = 10) -> bool:
+    """Whether the stripped text of an element is longer than min_length,
+    reading only as many text nodes as needed"""
+    length = 0
+    for text in _TEXT(element):
+        length += len(text.strip())
+        if length > min_length:
+            return True
+    return False
+
+
+def dedup_key(title: str, category: str) -> tuple:
+    """Key under which a feature counts as already seen, ignoring case,
+    whitespace runs and trailing punctuation"""
+    return tuple(
+        _WHITESPACE_RE.sub(' ', value).strip().rstrip('.,;:!? ').casefold()
+        for value in (title, category)
+    )
+
+
+def _line_break_markdown(parser, element) -> str:
+    return '\n'
+
+
+def _bold_markdown(parser, element) -> str:
+    content = parser.convert_to_markdown(element)
+    return f"**{content}**" if content else ""
+
+
+def _italic_markdown(parser, element) -> str:
+    content = parser.convert_to_markdown(element)
+    return f"*{content}*" if content else ""
+
+
+def _code_markdown(parser, element) -> str:
+    return f"`{get_text(element)}`"
+
+
+def _link_markdown(parser, element) -> str:
+    link_text = get_text(element)
+    href = element.get('href', '')
+    if not href:
+        return link_text
+    
+    # Handle relative URLs
+    if href.startswith('/'):
+        href = f"https://docs.netskope.com{href}"
+    elif not href.startswith(('http://', 'https://', 'mailto:', '#')):
+        href = f"https://docs.netskope.com/{href}"
+    return f"[{link_text}]({href})"
+
+
+def _image_markdown(parser, element) -> str:
+    return _normalize_image(element.get('src', ''), element.get('alt', 'Image'))
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_image(src: str, alt: str) -> str:
+    """Build image markdown; pages reference the same images repeatedly"""
+    if not src:
+        return ""
+    
+    # Handle relative URLs
+    if src.startswith('/'):
+        src = f"https://docs.netskope.com{src}"
+    # Only include content images, not icons
+    if 'wp-content/uploads' in src or (src.startswith('http') and 'icon' not in src.lower()):
+        return f"![{alt}]({src})"
+    return ""
+
 
-@dataclass
+def _nested_list_markdown(parser, element) -> str:
+    content = parser.process_element(element)
+    return '\n' + content if content else ""
+
+
+# Inline markdown conversion per child tag, looked up once per node
+_MARKDOWN_HANDLERS = {
+    'br': _line_break_markdown,
+    'strong': _bold_markdown,
+    'b': _bold_markdown,
+    'em': _italic_markdown,
+    'i': _italic_markdown,
+    'code': _code_markdown,
+    'a': _link_markdown,
+    'img': _image_markdown,
+    'ul': _nested_list_markdown,
+    'ol': _nested_list_markdown,
+}
+# Descendants that keep convert_to_markdown from taking its plain-text fast path
+_FORMATTED_TAGS = tuple(_MARKDOWN_HANDLERS) + tuple(SKIP_TAGS)
+
+
+@dataclass(slots=True)
 class Feature:
     """Represents a single feature in the release notes"""
     title: str
@@ -32,15 +180,15 @@ class Feature:
         return f"## {self.title}\n\n{self.description}\n\n*Category: {self.category}*"
 
 
-@dataclass
+@dataclass(slots=True)
 class ReleaseNotes:
     """Container for all release notes"""
     version: str
     features: List[Feature] = field(default_factory=list)
     
-    def to_json(self) -> str:
-        """Export release notes as JSON"""
-        data = {
+    def to_dict(self) -> dict:
+        """Export release notes as a JSON-serializable dict"""
+        return {
             "version": self.version,
             "features": [
                 {
@@ -51,7 +199,69 @@ class ReleaseNotes:
                 for f in self.features
             ]
         }
-        return json.dumps(data, ensure_ascii=False, indent=2)
+    
+    def to_json(self) -> str:
+        """Export release notes as JSON"""
+        return json_dumps(self.to_dict())
+    
+    def dump_json(self, fp: TextIO) -> None:
+        """Write release notes as JSON to a file object"""
+        json_dump(self.to_dict(), fp)
+
+
+# Resources the parser never reads; aborting them lets pages settle sooner
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+BLOCKED_HOSTS = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'hotjar.com',
+    'segment.io'
+)
+
+
+def _block_unneeded_requests(route):
+    """Abort media, styling and analytics requests; let documents and scripts through"""
+    request = route.request
+    host = urlparse(request.url).hostname or ''
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        host == blocked or host.endswith('.' + blocked) for blocked in BLOCKED_HOSTS
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
+
+class BrowserPool:
+    """Playwright browser shared by every fetch in this process, started on first use"""
+    _playwright = None
+    _browser = None
+    _context = None
+    
+    @classmethod
+    def get_page(cls):
+        """Open a new page in the shared browser context"""
+        if cls._context is None:
+            # Imported lazily, playwright alone costs more than the rest of startup
+            from playwright.sync_api import sync_playwright
+            
+            cls._playwright = sync_playwright().start()
+            cls._browser = cls._playwright.chromium.launch(headless=True)
+            cls._context = cls._browser.new_context()
+            cls._context.route('**/*', _block_unneeded_requests)
+        return cls._context.new_page()
+    
+    @classmethod
+    def shutdown(cls):
+        """Close the shared browser and stop Playwright"""
+        if cls._browser is not None:
+            cls._browser.close()
+        if cls._playwright is not None:
+            cls._playwright.stop()
+        cls._playwright = cls._browser = cls._context = None
+
+
+atexit.register(BrowserPool.shutdown)
 
 
 class ReleaseNotesParser:
@@ -60,29 +270,47 @@ class ReleaseNotesParser:
     def __init__(self, url: str):
         self.url = url
     
+    @classmethod
+    def parse_many(cls, urls: List[str]) -> List[ReleaseNotes]:
+        """Fetch and parse several pages, sharing one browser and context"""
+        results = []
+        for url in urls:
+            parser = cls(url)
+            results.append(parser.parse_html(parser.fetch_with_playwright()))
+        return results
+    
     def fetch_with_playwright(self) -> str:
         """Fetch the page using Playwright and expand all content"""
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            
-            logger.info(f"Fetching page with Playwright: {self.url}")
-            page.goto(self.url, wait_until='networkidle')
-            
-            # Wait for content to load
-            page.wait_for_timeout(3000)
-            
-            # Expand all content
-            self.expand_all_content(page)
-            
-            # Get the HTML content
-            html_content = page.content()
-            browser.close()
-            
-            return html_content
+        page = BrowserPool.get_page()
+        try:
+            return self.fetch_page(page)
+        finally:
+            page.close()
+    
+    def fetch_page(self, page) -> str:
+        """Load the page in an open Playwright page and return its expanded HTML"""
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        
+        logger.info(f"Fetching page with Playwright: {self.url}")
+        page.goto(self.url, wait_until='domcontentloaded')
+        
+        # Wait for content to load; headings may sit in hidden tabs or collapsed
+        # sections until expanded, and only the DOM is parsed, so don't wait for visibility
+        try:
+            page.wait_for_selector(CONTENT_READY_SELECTOR, state='attached', timeout=10000)
+        except PlaywrightTimeoutError:
+            logger.warning("Timed out waiting for content headings, parsing page as loaded")
+        
+        # Expand all content
+        self.expand_all_content(page)
+        
+        # Get the HTML content
+        return page.content()
     
     def expand_all_content(self, page):
         """Expand all collapsible content on the page"""
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        
         try:
             # Click on "What's New" tab if present
             try:
@@ -94,112 +322,103 @@ class ReleaseNotesParser:
             except:
                 pass
             
-            # Expand all accordion items
-            # Look for various types of expandable elements
-            expandable_selectors = [
-                'button[aria-expanded="false"]',
-                '.accordion-toggle[aria-expanded="false"]',
-                '.collapsible:not(.active)',
-                '[data-toggle="collapse"]:not(.collapsed)',
-                '.expandable:not(.expanded)'
-            ]
-            
-            for selector in expandable_selectors:
-                elements = page.query_selector_all(selector)
-                for element in elements:
-                    try:
-                        element.click()
-                        page.wait_for_timeout(100)
-                    except:
-                        continue
+            # Expand all accordion items in one round trip to the browser
+            clicked = page.evaluate(_EXPAND_ALL_JS, EXPANDABLE_SELECTORS)
             
-            # Final wait for all content to expand
-            page.wait_for_timeout(2000)
-            logger.info("Expanded all collapsible content")
+            # Let content loaded by the expanded sections arrive, but don't
+            # wait on background polling that keeps the network busy
+            try:
+                page.wait_for_load_state('networkidle', timeout=3000)
+            except PlaywrightTimeoutError:
+                logger.debug("Network still busy after expanding content, continuing")
+            logger.info(f"Expanded {clicked} collapsible elements")
             
         except Exception as e:
             logger.debug(f"Error expanding content: {e}")
     
     def parse_html(self, html_content: str) -> ReleaseNotes:
         """Parse HTML content and extract release notes"""
-        soup = BeautifulSoup(html_content, 'html.parser')
+        root = html.fromstring(html_content, parser=_HTML_PARSER)
         
         # Extract version from URL or page
-        version = self.extract_version(soup)
+        version = self.extract_version(root)
         
         # Initialize release notes
         release_notes = ReleaseNotes(version=version)
         
         # Parse features using improved logic
-        features = self.parse_features(soup)
-        
-        # Deduplicate features
-        seen = set()
-        for feature in features:
-            key = (feature.title, feature.category)
-            if key not in seen:
-                seen.add(key)
-                release_notes.features.append(feature)
+        release_notes.features.extend(self.parse_features(root))
         
         return release_notes
     
-    def extract_version(self, soup: BeautifulSoup) -> str:
+    def extract_version(self, root: html.HtmlElement) -> str:
         """Extract version number from page"""
         # Try to extract from URL
         if 'release-' in self.url:
-            match = re.search(r'release-(\d+-\d+-\d+)', self.url)
+            match = _RELEASE_URL_RE.search(self.url)
             if match:
                 return match.group(1).replace('-', '.')
         
         # Try to extract from page title or heading
-        title = soup.find('title')
-        if title:
-            match = re.search(r'(\d+\.\d+\.\d+)', title.text)
+        title = root.find('.//title')
+        if title is not None:
+            match = _VERSION_RE.search(title.text_content())
             if match:
                 return match.group(1)
         
-        h1 = soup.find('h1')
-        if h1:
-            match = re.search(r'(\d+\.\d+\.\d+)', h1.text)
+        h1 = root.find('.//h1')
+        if h1 is not None:
+            match = _VERSION_RE.search(h1.text_content())
             if match:
                 return match.group(1)
         
         return 'Unknown'
     
-    def parse_features(self, soup: BeautifulSoup) -> List[Feature]:
-        """Parse features with improved structure recognition"""
-        features = []
+    def find_main_content(self, root: html.HtmlElement) -> html.HtmlElement:
+        """Find the main content area, falling back to the whole document"""
+        for xpath in _MAIN_CONTENT:
+            matches = xpath(root)
+            if matches:
+                return matches[0]
+        return root
+    
+    def parse_features(self, root: html.HtmlElement) -> Iterator[Feature]:
+        """Parse features with improved structure recognition, skipping duplicates"""
+        seen = set()
         current_category = "General"
         
         # Find main content area
-        main_content = soup.find('main') or soup.find('article') or soup.find('div', class_='content') or soup
+        main_content = self.find_main_content(root)
         
         # Get all headings
-        headings = main_content.find_all(['h2', 'h3', 'h4', 'h5', 'h6'])
+        headings = _HEADINGS(main_content)
+        siblings = self.index_siblings(headings)
         
-        for i, heading in enumerate(headings):
-            text = heading.get_text(strip=True)
+        # Each heading is paired with the one after it (None for the last)
+        for heading, next_heading in zip_longest(headings, headings[1:]):
+            tag = heading.tag
+            text = get_text(heading)
+            children, position, end = siblings[heading]
             
             # Skip empty or too short headings
             if not text or len(text) < 3:
                 continue
             
             # Skip navigation or meta headings
-            if any(skip in text.lower() for skip in ['table of contents', 'navigation', 'menu', 'search']):
+            lowered = text.lower()
+            if any(skip in lowered for skip in NAVIGATION_KEYWORDS):
                 continue
             
             # H2 and H3 at top level are usually categories
-            if heading.name in ['h2', 'h3']:
+            if tag in CATEGORY_TAGS:
                 # Check if this is a category or a feature title
                 # Look ahead to see if there's another heading immediately after
-                next_heading = None
-                if i + 1 < len(headings):
-                    next_heading = headings[i + 1]
-                
                 # If the next heading is the same level or lower, this is likely a category
-                if next_heading and next_heading.name in ['h3', 'h4', 'h5', 'h6']:
+                if next_heading is not None and next_heading.tag in SUBHEADING_TAGS:
                     # Check if they are close together (category -> title pattern)
-                    elements_between = self.count_elements_between(heading, next_heading)
+                    # A next heading outside this parent never ends the sibling run
+                    stop = end if next_heading.getparent() is heading.getparent() else len(children)
+                    elements_between = self.count_elements_between(children[position + 1:stop], limit=3)
                     
                     if elements_between < 3:  # Close together, likely category-title pair
                         current_category = text
@@ -207,109 +426,121 @@ class ReleaseNotesParser:
                         continue
                 
                 # This heading might be a feature title
-                description = self.get_feature_description(heading)
+                description = self.get_feature_description(children[position + 1:end])
                 if description:
-                    feature = Feature(
-                        title=text,
-                        description=description,
-                        category=current_category
-                    )
-                    features.append(feature)
-                    logger.debug(f"Found feature: {text}")
+                    key = dedup_key(text, current_category)
+                    if key not in seen:
+                        seen.add(key)
+                        logger.debug(f"Found feature: {text}")
+                        yield Feature(
+                            title=text,
+                            description=description,
+                            category=current_category
+                        )
                 else:
                     # Might be a category if no description
                     current_category = text
                     logger.debug(f"Set as category (no description): {current_category}")
             
             # H4, H5, H6 are usually feature titles
-            elif heading.name in ['h4', 'h5', 'h6']:
-                description = self.get_feature_description(heading)
+            else:
+                # Duplicates are dropped before their description is extracted
+                key = dedup_key(text, current_category)
+                if key in seen:
+                    continue
+                
+                description = self.get_feature_description(children[position + 1:end])
                 if description:
-                    feature = Feature(
+                    seen.add(key)
+                    logger.debug(f"Found feature: {text}")
+                    yield Feature(
                         title=text,
                         description=description,
                         category=current_category
                     )
-                    features.append(feature)
-                    logger.debug(f"Found feature: {text}")
+    
+    def index_siblings(self, headings: List) -> Dict[html.HtmlElement, Tuple[List, int, int]]:
+        """Map each heading to its parent's element children, its position among them
+        and the position of the next heading sibling"""
+        siblings = {}
         
-        return features
+        for heading in headings:
+            if heading in siblings:
+                continue
+            
+            # One pass over each parent's children covers all headings under it
+            children = list(heading.getparent().iterchildren(tag=etree.Element))
+            positions = [i for i, child in enumerate(children) if child.tag in HEADING_TAGS]
+            for position, end in zip(positions, positions[1:] + [len(children)]):
+                siblings[children[position]] = (children, position, end)
+        
+        return siblings
     
-    def count_elements_between(self, elem1, elem2) -> int:
-        """Count significant elements between two elements"""
+    def count_elements_between(self, elements: List, limit: int) -> int:
+        """Count significant elements in a run of siblings, stopping once limit is reached"""
         count = 0
-        current = elem1.find_next_sibling()
         
-        while current and current != elem2:
-            if current.name and current.name not in ['br', 'hr']:
-                # Check if element has substantial content
-                text = current.get_text(strip=True)
-                if text and len(text) > 10:
-                    count += 1
-            current = current.find_next_sibling()
+        for current in elements:
+            if current.tag not in SPACER_TAGS and has_substantial_text(current):
+                count += 1
+                if count >= limit:
+                    break
         
         return count
     
-    def get_feature_description(self, heading) -> str:
-        """Get the description following a feature heading"""
+    def get_feature_description(self, elements: List) -> str:
+        """Get the description from the siblings following a feature heading"""
         description_parts = []
-        current = heading.find_next_sibling()
+        content_length = 0
         
-        while current:
-            # Stop at next heading
-            if current.name and current.name in ['h2', 'h3', 'h4', 'h5', 'h6']:
-                break
-            
+        for current in elements:
             # Process the element
-            if current.name:
-                content = self.process_element(current)
-                if content and len(content) > 5:
-                    description_parts.append(content)
-            
-            current = current.find_next_sibling()
+            content = self.process_element(current)
+            if content and len(content) > 5:
+                description_parts.append(content)
+                content_length += len(content)
             
-            # Stop if we have enough content
-            if len('\n'.join(description_parts)) > 1500:
+            # Stop if we have enough content (parts plus the newlines joining them)
+            if content_length + len(description_parts) - 1 > 1500:
                 break
         
         return '\n\n'.join(description_parts).strip()
     
     def process_element(self, element) -> str:
         """Process an element and convert to markdown"""
-        if not element.name:
-            return ""
+        tag = element.tag
         
         # Handle lists
-        if element.name == 'ul':
+        if tag == 'ul':
             items = []
-            for li in element.find_all('li', recursive=False):
+            for li in element.iterchildren('li'):
                 li_content = self.convert_to_markdown(li)
                 if li_content:
                     items.append(f"- {li_content}")
             return '\n'.join(items)
         
-        elif element.name == 'ol':
+        elif tag == 'ol':
             items = []
-            for i, li in enumerate(element.find_all('li', recursive=False), 1):
+            for i, li in enumerate(element.iterchildren('li'), 1):
                 li_content = self.convert_to_markdown(li)
                 if li_content:
                     items.append(f"{i}. {li_content}")
             return '\n'.join(items)
         
         # Handle paragraphs and divs
-        elif element.name in ['p', 'div', 'section', 'article']:
+        elif tag in BLOCK_TAGS:
             content = self.convert_to_markdown(element)
             return content if content else ""
         
         # Handle blockquotes
-        elif element.name == 'blockquote':
+        elif tag == 'blockquote':
             content = self.convert_to_markdown(element)
             return f"> {content}" if content else ""
         
         # Handle code blocks
-        elif element.name in ['pre', 'code']:
-            code = element.get_text(strip=True)
-            if element.name == 'pre':
+        elif tag in ['pre', 'code']:
+            code = get_text(element)
+            if tag == 'pre':
                 return f"```\n{code}\n```"
             else:
                 return f"`{code}`"
@@ -320,80 +551,38 @@ class ReleaseNotesParser:
     
     def convert_to_markdown(self, element) -> str:
         """Convert HTML element to markdown format"""
-        if isinstance(element, str):
-            return element.strip()
+        # Leaf or text-only wrapper: no need to recurse
+        if len(element) == 0:
+            return (element.text or '').strip()
+        if next(element.iterdescendants(*_FORMATTED_TAGS), None) is None:
+            return ' '.join(text.strip() for text in _TEXT(element) if text.strip())
         
         result = []
         
-        for child in element.children:
-            if isinstance(child, str):
-                text = child.strip()
-                if text:
-                    result.append(text)
-            
-            elif child.name == 'br':
-                result.append('\n')
-            
-            elif child.name in ['strong', 'b']:
-                content = self.convert_to_markdown(child)
-                if content:
-                    result.append(f"**{content}**")
-            
-            elif child.name in ['em', 'i']:
+        if element.text:
+            text = element.text.strip()
+            if text:
+                result.append(text)
+        
+        for child in element:
+            tag = child.tag
+            handler = _MARKDOWN_HANDLERS.get(tag)
+            if handler is not None:
+                content = handler(self, child)
+            elif isinstance(tag, str) and tag not in SKIP_TAGS:
+                # Other elements (span, div, ...) - get text content
                 content = self.convert_to_markdown(child)
-                if content:
-                    result.append(f"*{content}*")
-            
-            elif child.name == 'code':
-                result.append(f"`{child.get_text(strip=True)}`")
-            
-            elif child.name == 'a':
-                link_text = child.get_text(strip=True)
-                href = child.get('href', '')
-                if href:
-                    # Handle relative URLs
-                    if href.startswith('/'):
-                        href = f"https://docs.netskope.com{href}"
-                    elif not href.startswith(('http://', 'https://', 'mailto:', '#')):
-                        href = f"https://docs.netskope.com/{href}"
-                    result.append(f"[{link_text}]({href})")
-                else:
-                    result.append(link_text)
-            
-            elif child.name == 'img':
-                src = child.get('src', '')
-                alt = child.get('alt', 'Image')
-                if src:
-                    # Handle relative URLs
-                    if src.startswith('/'):
-                        src = f"https://docs.netskope.com{src}"
-                    # Only include content images, not icons
-                    if 'wp-content/uploads' in src or (src.startswith('http') and 'icon' not in src.lower()):
-                        result.append(f"![{alt}]({src})")
-            
-            elif child.name == 'ul':
-                # Nested list
-                ul_content = self.process_element(child)
-                if ul_content:
-                    result.append('\n' + ul_content)
-            
-            elif child.name == 'ol':
-                # Nested list
-                ol_content = self.process_element(child)
-                if ol_content:
-                    result.append('\n' + ol_content)
+            else:
+                content = None
             
-            elif child.name in ['span', 'div']:
-                # Process inline elements
-                content = self.convert_to_markdown(child)
-                if content:
-                    result.append(content)
+            if content:
+                result.append(content)
             
-            elif child.name not in ['script', 'style', 'noscript']:
-                # Other elements - get text content
-                content = self.convert_to_markdown(child)
-                if content:
-                    result.append(content)
+            # Text following the child element belongs to this element
+            if child.tail:
+                text = child.tail.strip()
+                if text:
+                    result.append(text)
         
         return ' '.join(result).strip()
 
@@ -401,9 +590,21 @@ class ReleaseNotesParser:
 def main():
     """Main entry point"""
     if len(sys.argv) < 2:
-        print("Usage: parse_release_notes_playwright.py <url>")
+        print("Usage: parse_release_notes_playwright.py <url> [<url> ...]")
         sys.exit(1)
     
+    # Several URLs share one browser and are output as a JSON array
+    if len(sys.argv) > 2:
+        try:
+            all_release_notes = ReleaseNotesParser.parse_many(sys.argv[1:])
+            json_dump([rn.to_dict() for rn in all_release_notes], sys.stdout)
+            sys.stdout.write('\n')
+            logger.info(f"Successfully parsed {len(all_release_notes)} release notes pages")
+        except Exception as e:
+            logger.error(f"Failed to parse release notes: {e}")
+            sys.exit(1)
+        return
+    
     url = sys.argv[1]
     
     try:
@@ -413,7 +614,8 @@ def main():
         release_notes = parser.parse_html(html_content)
         
         # Output as JSON
-        print(release_notes.to_json())
+        release_notes.dump_json(sys.stdout)
+        sys.stdout.write('\n')
         
         # Log summary
         logger.info(f"Successfully parsed {len(release_notes.features)} features")
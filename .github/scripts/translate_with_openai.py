@@ -3,20 +3,36 @@
 Translate release notes using OpenAI GPT-4o API
 """
 
+import asyncio
 import json
 import os
 import sys
-import time
 from typing import Dict, List
 import openai
-from openai import OpenAI
+from openai import AsyncOpenAI
 
-def translate_text(client: OpenAI, text: str, context: str = "") -> str:
-    """
-    Translate English text to Japanese using GPT-4o
-    """
-    try:
-        system_prompt = """You are a professional technical translator specializing in IT and cloud security.
+from json_output import json_dumps
+from translation_cache import TranslationCache
+
+# Number of feature descriptions translated per API request
+BATCH_SIZE = 8
+
+# Requests in flight at once; rate-limited requests are retried by the client,
+# which backs off exponentially and honours the API's Retry-After headers
+CONCURRENCY = 8
+MAX_RETRIES = 5
+
+# OpenAI Batch API: half-price, asynchronous processing for CI runs with BATCH_MODE=true
+BATCH_POLL_INTERVAL = 30  # seconds between status checks
+# Give up (and cancel the batch) well before the CI job itself would be killed
+BATCH_TIMEOUT = int(os.environ.get('BATCH_TIMEOUT', 1800))  # seconds
+BATCH_CANCEL_TIMEOUT = 600  # seconds to wait for a cancelled batch to settle
+BATCH_FINAL_STATUSES = ('completed', 'failed', 'expired', 'cancelled')
+
+# Marks a description that could not be translated; such results are never cached
+TRANSLATION_ERROR_PREFIX = "[翻訳エラー"
+
+SYSTEM_PROMPT = """You are a professional technical translator specializing in IT and cloud security.
 Translate the following English text to Japanese, maintaining:
 1. Technical accuracy
 2. Proper IT terminology in Japanese
@@ -31,26 +47,214 @@ Important:
 - Only translate the provided text, do not add context information
 - Do NOT add or duplicate any titles/headings that aren't in the original text"""
 
-        user_prompt = f"Translate ONLY the following text to Japanese (DO NOT add titles or headings):\n\n{text}"
+
+def feature_context(feature: Dict) -> str:
+    """
+    Reference context sent alongside a feature description
+    """
+    return f"Feature: {feature['title']}, Category: {feature['category']}"
+
+
+def translation_request(text: str, context: str = "") -> Dict:
+    """
+    Chat completion parameters for translating a single text
+    """
+    user_prompt = f"Translate ONLY the following text to Japanese (DO NOT add titles or headings):\n\n{text}"
+    
+    if context:
+        user_prompt = f"Reference context (DO NOT include in translation): {context}\n\n{user_prompt}"
+    
+    return {
+        "model": "gpt-4o",
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ],
+        "temperature": 0.3,  # Lower temperature for more consistent translations
+        "max_tokens": 2000
+    }
+
+
+async def translate_text(client: AsyncOpenAI, text: str, context: str = "") -> str:
+    """
+    Translate English text to Japanese using GPT-4o
+    """
+    try:
+        response = await client.chat.completions.create(**translation_request(text, context))
         
-        if context:
-            user_prompt = f"Reference context (DO NOT include in translation): {context}\n\n{user_prompt}"
+        return response.choices[0].message.content.strip()
+    
+    except Exception as e:
+        print(f"Translation error: {e}", file=sys.stderr)
+        return f"{TRANSLATION_ERROR_PREFIX}: {str(e)}]\n\n{text}"
 
-        response = client.chat.completions.create(
+
+async def translate_batch(client: AsyncOpenAI, features: List[Dict]) -> List[str]:
+    """
+    Translate the descriptions of several features to Japanese in one request,
+    falling back to one request per feature if the reply can't be used
+    """
+    items = [
+        {"context": feature_context(feature), "text": feature['description']}
+        for feature in features
+    ]
+    user_prompt = (
+        f"Translate ONLY the \"text\" of each of the following {len(items)} items to Japanese "
+        "(DO NOT add titles or headings, DO NOT include the reference \"context\" in translations).\n"
+        f"Respond with a JSON object {{\"translations\": [...]}} containing exactly {len(items)} "
+        "translated strings, in the same order as the items.\n\n"
+        f"{json.dumps(items, ensure_ascii=False)}"
+    )
+    
+    try:
+        response = await client.chat.completions.create(
             model="gpt-4o",
             messages=[
-                {"role": "system", "content": system_prompt},
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt}
             ],
             temperature=0.3,  # Lower temperature for more consistent translations
-            max_tokens=2000
+            max_tokens=min(2000 * len(items), 16000),
+            response_format={"type": "json_object"}
         )
         
-        return response.choices[0].message.content.strip()
+        translations = json.loads(response.choices[0].message.content)['translations']
+        # Anything but a list of non-empty strings would end up in the cache
+        if not isinstance(translations, list):
+            raise ValueError(f"expected a list of translations, got {type(translations).__name__}")
+        if len(translations) != len(items) or not all(isinstance(t, str) and t.strip() for t in translations):
+            raise ValueError(f"expected {len(items)} non-empty translations, got {translations!r:.200}")
+        return [t.strip() for t in translations]
     
     except Exception as e:
-        print(f"Translation error: {e}", file=sys.stderr)
-        return f"[翻訳エラー: {str(e)}]\n\n{text}"
+        print(f"Batch translation error, translating one by one: {e}", file=sys.stderr)
+        return await asyncio.gather(*(
+            translate_text(client, feature['description'], context=feature_context(feature))
+            for feature in features
+        ))
+
+
+async def translate_with_batch_api(client: AsyncOpenAI, features: List[Dict]) -> List[str]:
+    """
+    Translate feature descriptions through the OpenAI Batch API, one request per feature,
+    and wait for the batch to finish
+    """
+    lines = [
+        json.dumps({
+            "custom_id": f"{i}-desc",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": translation_request(feature['description'], context=feature_context(feature))
+        }, ensure_ascii=False)
+        for i, feature in enumerate(features)
+    ]
+    
+    try:
+        batch_file = await client.files.create(
+            file=("translations.jsonl", "\n".join(lines).encode('utf-8')),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+    except Exception as e:
+        print(f"Could not submit batch, translating concurrently: {e}", file=sys.stderr)
+        return await translate_concurrently(client, features)
+    print(f"Submitted batch {batch.id} with {len(lines)} requests", file=sys.stderr)
+    
+    batch = await wait_for_batch(client, batch)
+    
+    # Map successful responses back to features by custom_id; a cancelled,
+    # failed or expired batch can still have results for part of its requests
+    translations = {}
+    if batch.output_file_id:
+        try:
+            output = await client.files.content(batch.output_file_id)
+        except Exception as e:
+            print(f"Could not download results of batch {batch.id}: {e}", file=sys.stderr)
+        else:
+            for line in output.text.splitlines():
+                result = json.loads(line)
+                response = result.get('response')
+                if response and response['status_code'] == 200:
+                    content = response['body']['choices'][0]['message']['content']
+                    translations[result['custom_id']] = content.strip()
+    
+    # Whatever the batch didn't deliver is translated directly
+    missing = [i for i in range(len(features)) if f"{i}-desc" not in translations]
+    if missing:
+        print(f"Batch {batch.id} ({batch.status}) returned {len(features) - len(missing)}/{len(features)} "
+              f"translations, translating the rest concurrently", file=sys.stderr)
+        descriptions_ja = await translate_concurrently(client, [features[i] for i in missing])
+        for i, description_ja in zip(missing, descriptions_ja):
+            translations[f"{i}-desc"] = description_ja
+    
+    return [translations[f"{i}-desc"] for i in range(len(features))]
+
+
+async def wait_for_batch(client: AsyncOpenAI, batch):
+    """
+    Poll a batch until it reaches a final status. After BATCH_TIMEOUT seconds, or if its
+    status can't be retrieved, the batch is cancelled so finished requests can be harvested
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + BATCH_TIMEOUT
+    cancelled = False
+    
+    while batch.status not in BATCH_FINAL_STATUSES:
+        if loop.time() >= deadline:
+            if cancelled:
+                print(f"Batch {batch.id} still {batch.status} after cancelling, giving up on it", file=sys.stderr)
+                break
+            print(f"Batch {batch.id} not finished after {BATCH_TIMEOUT}s, cancelling", file=sys.stderr)
+            if not await cancel_batch(client, batch):
+                break
+            cancelled = True
+            deadline = loop.time() + BATCH_CANCEL_TIMEOUT
+        
+        await asyncio.sleep(BATCH_POLL_INTERVAL)
+        try:
+            batch = await client.batches.retrieve(batch.id)
+        except Exception as e:
+            print(f"Could not check batch {batch.id}: {e}", file=sys.stderr)
+            if not cancelled:
+                await cancel_batch(client, batch)
+            break
+        print(f"Batch {batch.id}: {batch.status}", file=sys.stderr)
+    
+    return batch
+
+
+async def cancel_batch(client: AsyncOpenAI, batch) -> bool:
+    """
+    Ask the API to cancel a batch; returns whether the request went through
+    """
+    try:
+        await client.batches.cancel(batch.id)
+        return True
+    except Exception as e:
+        print(f"Could not cancel batch {batch.id}: {e}", file=sys.stderr)
+        return False
+
+
+async def translate_concurrently(client: AsyncOpenAI, features: List[Dict]) -> List[str]:
+    """
+    Translate feature descriptions in batches of chat completions, several at a time
+    """
+    batches = [features[start:start + BATCH_SIZE] for start in range(0, len(features), BATCH_SIZE)]
+    semaphore = asyncio.Semaphore(CONCURRENCY)
+    
+    async def run_batch(start: int, batch: List[Dict]) -> List[str]:
+        async with semaphore:
+            print(f"Translating [{start + 1}-{start + len(batch)}/{len(features)}]...", file=sys.stderr)
+            return await translate_batch(client, batch)
+    
+    results = await asyncio.gather(*(
+        run_batch(i * BATCH_SIZE, batch) for i, batch in enumerate(batches)
+    ))
+    return [description_ja for result in results for description_ja in result]
 
 
 def create_bilingual_content(title: str, content: str, title_en: str, content_ja: str, category: str) -> str:
@@ -67,32 +271,59 @@ def create_bilingual_content(title: str, content: str, title_en: str, content_ja
     return bilingual
 
 
-def translate_features(features: List[Dict], api_key: str) -> List[Dict]:
+async def translate_features_async(features: List[Dict], api_key: str) -> List[Dict]:
     """
-    Translate all features using OpenAI API
+    Translate all features using OpenAI API, running batches concurrently.
+    Descriptions already translated in this or an earlier run are not sent again.
     """
-    client = OpenAI(api_key=api_key)
-    translated_features = []
-    
     total = len(features)
     print(f"Translating {total} features using GPT-4o...", file=sys.stderr)
     
-    for i, feature in enumerate(features, 1):
-        print(f"Translating [{i}/{total}]: {feature['title'][:50]}...", file=sys.stderr)
+    cache = TranslationCache()
+    try:
+        # Look up each distinct description once, queue the rest for translation
+        translations = {}
+        pending = {}
+        for feature in features:
+            text = feature['description']
+            if text in translations or text in pending:
+                continue
+            cached = cache.get(text)
+            if cached is not None:
+                translations[text] = cached
+            else:
+                pending[text] = feature
         
-        # Only translate description, keep title in English
-        description_ja = translate_text(
-            client,
-            feature['description'],
-            context=f"Feature: {feature['title']}, Category: {feature['category']}"
-        )
+        if len(pending) < total:
+            print(f"Reusing {total - len(pending)} cached or duplicate translations", file=sys.stderr)
+        
+        to_translate = list(pending.values())
         
+        # Only translate descriptions, keep titles in English
+        async with AsyncOpenAI(api_key=api_key, max_retries=MAX_RETRIES) as client:
+            if not to_translate:
+                descriptions_ja = []
+            elif os.environ.get('BATCH_MODE', '').lower() == 'true':
+                descriptions_ja = await translate_with_batch_api(client, to_translate)
+            else:
+                descriptions_ja = await translate_concurrently(client, to_translate)
+        
+        for feature, description_ja in zip(to_translate, descriptions_ja):
+            translations[feature['description']] = description_ja
+            # Failed translations are retried on the next run
+            if not description_ja.startswith(TRANSLATION_ERROR_PREFIX):
+                cache.put(feature['description'], description_ja)
+    finally:
+        cache.close()
+    
+    translated_features = []
+    for feature in features:
         # Create bilingual content with English title
         bilingual_description = create_bilingual_content(
             feature['title'],
             feature['description'],
             feature['title'],  # Use English title for both
-            description_ja,
+            translations[feature['description']],
             feature['category']
         )
         
@@ -102,14 +333,17 @@ def translate_features(features: List[Dict], api_key: str) -> List[Dict]:
             'title_en': feature['title'],  # Keep English title
             'description': bilingual_description  # Bilingual content
         })
-        
-        # Small delay to avoid rate limiting
-        if i < total:
-            time.sleep(0.5)
     
     return translated_features
 
 
+def translate_features(features: List[Dict], api_key: str) -> List[Dict]:
+    """
+    Translate all features using OpenAI API
+    """
+    return asyncio.run(translate_features_async(features, api_key))
+
+
 def main():
     """Main entry point"""
     # Check for API key
@@ -128,7 +362,7 @@ def main():
     # Check if translation is requested
     if os.environ.get('SKIP_TRANSLATION', '').lower() == 'true':
         print("Skipping translation as requested", file=sys.stderr)
-        print(json.dumps(data, ensure_ascii=False, indent=2))
+        print(json_dumps(data))
         return
     
     # Translate features
@@ -139,7 +373,7 @@ def main():
     data['translated'] = True
     
     # Output translated data
-    print(json.dumps(data, ensure_ascii=False, indent=2))
+    print(json_dumps(data))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,72 @@
+"""
+Persistent cache of translations keyed by a SHA-256 hash of the source text
+"""
+
+import hashlib
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_CACHE_PATH = Path(
+    os.environ.get('TRANSLATION_CACHE', Path.home() / '.cache' / 'netskope-trans' / 'cache.sqlite')
+)
+
+
+def text_key(text: str) -> str:
+    """
+    Cache key for a source text
+    """
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class TranslationCache:
+    """
+    SQLite-backed map of source text hash to translation.
+    If the database can't be opened the cache stays empty instead of failing the run.
+    """
+    
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH):
+        self.conn = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(path)
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS translations (key TEXT PRIMARY KEY, translation TEXT NOT NULL)'
+            )
+        except (OSError, sqlite3.Error) as e:
+            print(f"Translation cache disabled: {e}", file=sys.stderr)
+            self.conn = None
+    
+    def get(self, text: str) -> Optional[str]:
+        """
+        Return the cached translation of text, if any
+        """
+        if self.conn is None:
+            return None
+        row = self.conn.execute(
+            'SELECT translation FROM translations WHERE key = ?', (text_key(text),)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def put(self, text: str, translation: str) -> None:
+        """
+        Store the translation of text
+        """
+        if self.conn is None:
+            return
+        self.conn.execute(
+            'INSERT OR REPLACE INTO translations (key, translation) VALUES (?, ?)',
+            (text_key(text), translation)
+        )
+    
+    def close(self) -> None:
+        """
+        Commit pending writes and close the database
+        """
+        if self.conn is None:
+            return
+        self.conn.commit()
+        self.conn.close()
+        self.conn = None